@@ -3,21 +3,25 @@ Implementasi Algoritma Greedy - Nearest Neighbor
 untuk Optimasi Rute Pengiriman Barang
 """
 
+import heapq
 import math
-from data_lokasi import LOKASI, get_semua_lokasi
+from data_lokasi import LOKASI, get_jendela_waktu
+from cache_jarak import CacheJarak, CACHE_JARAK_BERSAMA
+from hasil_rute import HasilRute
 
 class AlgoritmaGreedy:
     """Implementasi Algoritma Nearest Neighbor untuk TSP"""
     
-    def __init__(self, lokasi_data):
+    def __init__(self, lokasi_data, jarak_cache=None):
         """
         Inisialisasi algoritma
         
         Args:
             lokasi_data: Dictionary berisi data lokasi dengan lat/long
+            jarak_cache: CacheJarak yang dipakai (default: CACHE_JARAK_BERSAMA)
         """
         self.lokasi = lokasi_data
-        self.jarak_cache = {}
+        self.jarak_cache = jarak_cache if jarak_cache is not None else CACHE_JARAK_BERSAMA
     
     def hitung_jarak(self, lokasi1_id, lokasi2_id):
         """
@@ -30,27 +34,47 @@ class AlgoritmaGreedy:
         Returns:
             Jarak dalam kilometer
         """
-        # Cek cache
-        key = (min(lokasi1_id, lokasi2_id), max(lokasi1_id, lokasi2_id))
-        if key in self.jarak_cache:
-            return self.jarak_cache[key]
-        
         loc1 = self.lokasi[lokasi1_id]
         loc2 = self.lokasi[lokasi2_id]
         
-        lat1, long1 = loc1["lat"], loc1["long"]
-        lat2, long2 = loc2["lat"], loc2["long"]
+        # Cek cache (kunci berdasarkan koordinat, bukan ID)
+        key = CacheJarak.buat_kunci(loc1["lat"], loc1["long"], loc2["lat"], loc2["long"])
+        jarak = self.jarak_cache.ambil(key)
+        if jarak is not None:
+            return jarak
+        
+        jarak = self._jarak_koordinat(loc1["lat"], loc1["long"], loc2["lat"], loc2["long"])
         
+        # Cache hasil
+        self.jarak_cache.simpan(key, jarak)
+        return jarak
+    
+    @staticmethod
+    def _jarak_koordinat(lat1, long1, lat2, long2):
+        """Jarak (km) antara dua koordinat tanpa melalui cache"""
         # Formula Haversine untuk jarak geografis (disederhanakan untuk Medan)
         # 1 derajat ≈ 111 km
         delta_lat = (lat2 - lat1) * 111
         delta_long = (long2 - long1) * 111 * math.cos(math.radians((lat1 + lat2) / 2))
         
-        jarak = math.sqrt(delta_lat**2 + delta_long**2)
+        return math.sqrt(delta_lat**2 + delta_long**2)
+    
+    def _susun_hasil(self, rute, jarak_leg=None, **atribut):
+        """
+        Menyusun HasilRute dari urutan rute (depot di awal dan akhir)
         
-        # Cache hasil
-        self.jarak_cache[key] = jarak
-        return jarak
+        Args:
+            rute: List ID lokasi (atau numpy array)
+            jarak_leg: Jarak tiap leg yang sudah dihitung (opsional, list atau numpy array)
+            **atribut: Argumen HasilRute lain (jumlah_lokasi, kecepatan, jadwal, ...)
+        """
+        if jarak_leg is None:
+            # Dihitung langsung agar satu rute besar tidak membanjiri cache bersama
+            koordinat = [(self.lokasi[i]["lat"], self.lokasi[i]["long"]) for i in rute]
+            jarak_leg = [self._jarak_koordinat(*koordinat[i], *koordinat[i+1])
+                         for i in range(len(rute) - 1)]
+        
+        return HasilRute(self.lokasi, rute, jarak_leg, **atribut)
     
     def nearest_neighbor(self, depot_id=0):
         """
@@ -67,63 +91,367 @@ class AlgoritmaGreedy:
             depot_id: ID depot (default: 0)
             
         Returns:
-            Dictionary dengan rute, total jarak, dan detail
+            HasilRute dengan rute, total jarak, dan detail
         """
         # Semua lokasi kecuali depot
-        semua_lokasi = set(get_semua_lokasi())
+        semua_lokasi = set(self.lokasi)
         semua_lokasi.discard(depot_id)
         
         rute = [depot_id]
         belum_dikunjungi = semua_lokasi.copy()
         lokasi_saat_ini = depot_id
-        total_jarak = 0
-        detail_rute = []
+        jarak_leg = []
+        
+        # Pemindaian O(n²) memakai koordinat langsung, bukan cache jarak bersama
+        koordinat = {i: (loc["lat"], loc["long"]) for i, loc in self.lokasi.items()}
+        jarak_koordinat = self._jarak_koordinat
         
         # Greedy Loop
         while belum_dikunjungi:
             # Cari lokasi terdekat dari lokasi saat ini
             lokasi_terdekat = None
             jarak_min = float('inf')
+            lat_saat_ini, long_saat_ini = koordinat[lokasi_saat_ini]
             
             for lokasi_id in belum_dikunjungi:
-                jarak = self.hitung_jarak(lokasi_saat_ini, lokasi_id)
+                jarak = jarak_koordinat(lat_saat_ini, long_saat_ini, *koordinat[lokasi_id])
                 
                 if jarak < jarak_min:
                     jarak_min = jarak
                     lokasi_terdekat = lokasi_id
             
             # Kunjungi lokasi terdekat
-            total_jarak += jarak_min
+            jarak_leg.append(jarak_min)
             rute.append(lokasi_terdekat)
             belum_dikunjungi.remove(lokasi_terdekat)
             
-            # Catat detail
-            detail_rute.append({
-                "dari": self.lokasi[lokasi_saat_ini]["nama"],
-                "ke": self.lokasi[lokasi_terdekat]["nama"],
-                "jarak": round(jarak_min, 2)
-            })
-            
             lokasi_saat_ini = lokasi_terdekat
         
         # Kembali ke depot
-        jarak_kembali = self.hitung_jarak(lokasi_saat_ini, depot_id)
-        total_jarak += jarak_kembali
+        jarak_leg.append(jarak_koordinat(*koordinat[lokasi_saat_ini], *koordinat[depot_id]))
         rute.append(depot_id)
         
-        detail_rute.append({
-            "dari": self.lokasi[lokasi_saat_ini]["nama"],
-            "ke": self.lokasi[depot_id]["nama"],
-            "jarak": round(jarak_kembali, 2)
-        })
-        
-        return {
-            "rute": rute,
-            "total_jarak": round(total_jarak, 2),
-            "jumlah_lokasi": len(get_semua_lokasi()) - 1,
-            "detail_rute": detail_rute,
-            "waktu_tempuh_menit": round((total_jarak / 40) * 60, 2)  # Asumsi kecepatan 40 km/jam
+        # Asumsi kecepatan 40 km/jam (lihat HasilRute)
+        return HasilRute(self.lokasi, rute, jarak_leg)
+    
+    def _buat_indeks_grid(self, ids):
+        """Membuat indeks grid dari koordinat lokasi yang diproyeksikan ke km"""
+        lat_ref = sum(self.lokasi[i]["lat"] for i in ids) / len(ids)
+        skala_long = 111 * math.cos(math.radians(lat_ref))
+        titik = {
+            i: (self.lokasi[i]["long"] * skala_long, self.lokasi[i]["lat"] * 111)
+            for i in ids
         }
+        return _IndeksGrid(titik)
+    
+    def greedy_edge(self, depot_id=0, k=10):
+        """
+        Algoritma Greedy Edge (Matching)
+        
+        Strategi:
+        1. Kumpulkan kandidat sisi dari k tetangga terdekat tiap lokasi
+        2. Urutkan kandidat dari yang terpendek
+        3. Terima sisi jika kedua ujungnya berderajat < 2 dan tidak
+           menutup siklus prematur (dicek dengan union-find)
+        4. Sambungkan fragmen-fragmen jalur menjadi satu tur, selalu ke
+           ujung fragmen terdekat
+        5. Putar tur agar dimulai dan diakhiri di depot
+        
+        Kompleksitas: O(n k log(n k))
+        
+        Args:
+            depot_id: ID depot (default: 0)
+            k: Jumlah tetangga terdekat per lokasi sebagai kandidat sisi
+            
+        Returns:
+            HasilRute, sama seperti nearest_neighbor()
+        """
+        ids = list(self.lokasi)
+        n = len(ids)
+        if n <= 2:
+            lainnya = [i for i in ids if i != depot_id]
+            return self._susun_hasil([depot_id] + lainnya + [depot_id])
+        
+        k = min(k, n - 1)
+        indeks = self._buat_indeks_grid(ids)
+        
+        # Kandidat sisi dari daftar k tetangga terdekat
+        kandidat = set()
+        for i in ids:
+            x, y = indeks.titik[i]
+            for j in indeks.terdekat(x, y, k, kecuali=i):
+                kandidat.add((i, j) if i < j else (j, i))
+        
+        sisi = sorted(
+            (self._jarak_koordinat(self.lokasi[a]["lat"], self.lokasi[a]["long"],
+                                   self.lokasi[b]["lat"], self.lokasi[b]["long"]), a, b)
+            for a, b in kandidat
+        )
+        
+        # Union-find dengan path halving dan union by size
+        induk = {i: i for i in ids}
+        ukuran = {i: 1 for i in ids}
+        
+        def cari(i):
+            while induk[i] != i:
+                induk[i] = induk[induk[i]]
+                i = induk[i]
+            return i
+        
+        tetangga = {i: [] for i in ids}
+        jumlah_sisi = 0
+        
+        for _, a, b in sisi:
+            if len(tetangga[a]) >= 2 or len(tetangga[b]) >= 2:
+                continue
+            akar_a, akar_b = cari(a), cari(b)
+            if akar_a == akar_b:
+                continue
+            if ukuran[akar_a] < ukuran[akar_b]:
+                akar_a, akar_b = akar_b, akar_a
+            induk[akar_b] = akar_a
+            ukuran[akar_a] += ukuran[akar_b]
+            
+            tetangga[a].append(b)
+            tetangga[b].append(a)
+            jumlah_sisi += 1
+            if jumlah_sisi == n - 1:
+                break
+        
+        # Pasangan ujung tiap fragmen (lokasi tunggal berpasangan dengan dirinya)
+        def telusuri(awal):
+            jalur = [awal]
+            sebelum, saat_ini = None, awal
+            while True:
+                lanjut = [j for j in tetangga[saat_ini] if j != sebelum]
+                if not lanjut:
+                    return jalur
+                sebelum, saat_ini = saat_ini, lanjut[0]
+                jalur.append(saat_ini)
+        
+        ujung = [i for i in ids if len(tetangga[i]) < 2]
+        indeks_ujung = _IndeksGrid({i: indeks.titik[i] for i in ujung}, indeks.ukuran_sel)
+        
+        # Sambungkan fragmen: dari ujung fragmen saat ini ke ujung terdekat fragmen lain
+        urutan = []
+        saat_ini = depot_id if depot_id in indeks_ujung.titik else ujung[0]
+        while True:
+            fragmen = telusuri(saat_ini)
+            urutan.extend(fragmen)
+            indeks_ujung.hapus(fragmen[0])
+            indeks_ujung.hapus(fragmen[-1])
+            if not indeks_ujung.jumlah:
+                break
+            x, y = indeks.titik[fragmen[-1]]
+            saat_ini = indeks_ujung.terdekat(x, y, 1)[0]
+        
+        # Putar tur agar dimulai dari depot
+        posisi = urutan.index(depot_id)
+        rute = urutan[posisi:] + urutan[:posisi] + [depot_id]
+        
+        return self._susun_hasil(rute)
+    
+    def kurva_hilbert(self, depot_id=0, orde=16):
+        """
+        Konstruksi rute dengan urutan kurva Hilbert (space-filling curve)
+        
+        Koordinat lat/long dipetakan ke grid 2^orde x 2^orde di atas bounding
+        box lokasi, indeks Hilbert tiap lokasi dihitung dengan operasi bit
+        vektorial, lalu lokasi diurutkan dengan satu argsort. Hasilnya kasar
+        (biasanya ~25% lebih panjang dari optimal) tetapi sangat cepat, cocok
+        sebagai seed heuristik perbaikan atau baseline di analisis_performa().
+        
+        Kompleksitas: O(n log n)
+        
+        Args:
+            depot_id: ID depot (default: 0)
+            orde: Jumlah bit per sumbu grid Hilbert (maks 31)
+            
+        Returns:
+            HasilRute, sama seperti nearest_neighbor()
+        """
+        import numpy as np
+        
+        n = len(self.lokasi)
+        ids = np.fromiter(self.lokasi.keys(), dtype=np.int64, count=n)
+        lat = np.fromiter((loc["lat"] for loc in self.lokasi.values()), dtype=np.float64, count=n)
+        long = np.fromiter((loc["long"] for loc in self.lokasi.values()), dtype=np.float64, count=n)
+        
+        # Skala seragam (sisi terpanjang bounding box) agar bentuk area tidak terdistorsi
+        sisi = 1 << orde
+        rentang = max(lat.max() - lat.min(), long.max() - long.min()) or 1.0
+        x = ((long - long.min()) / rentang * (sisi - 1)).astype(np.int64)
+        y = ((lat - lat.min()) / rentang * (sisi - 1)).astype(np.int64)
+        
+        # Indeks Hilbert (xy -> d), satu iterasi per bit untuk semua lokasi sekaligus
+        d = np.zeros(n, dtype=np.int64)
+        s = sisi >> 1
+        while s:
+            rx = (x & s) > 0
+            ry = (y & s) > 0
+            d += s * s * ((3 * rx) ^ ry)
+            
+            balik = rx & ~ry
+            x = np.where(balik, sisi - 1 - x, x)
+            y = np.where(balik, sisi - 1 - y, y)
+            tukar = ~ry
+            x, y = np.where(tukar, y, x), np.where(tukar, x, y)
+            s >>= 1
+        
+        urutan = np.argsort(d, kind="stable")
+        
+        # Putar tur agar dimulai dari depot
+        posisi = int(np.flatnonzero(ids[urutan] == depot_id)[0])
+        urutan = np.concatenate([urutan[posisi:], urutan[:posisi], urutan[posisi:posisi + 1]])
+        
+        # Jarak tiap leg, formula yang sama dengan _jarak_koordinat()
+        lat_r, long_r = lat[urutan], long[urutan]
+        delta_lat = np.diff(lat_r) * 111
+        delta_long = np.diff(long_r) * 111 * np.cos(np.radians((lat_r[:-1] + lat_r[1:]) / 2))
+        jarak_leg = np.sqrt(delta_lat**2 + delta_long**2)
+        
+        return self._susun_hasil(ids[urutan], jarak_leg)
+    
+    def insertion_jendela_waktu(self, depot_id=0, jam_mulai=8 * 60, kecepatan=40):
+        """
+        Algoritma Insertion Greedy dengan Jendela Waktu (VRPTW satu kendaraan)
+        
+        Strategi:
+        1. Mulai dari rute depot -> depot
+        2. Urutkan lokasi berdasarkan jam tutup (paling mendesak lebih dulu)
+        3. Sisipkan tiap lokasi di posisi dengan tambahan jarak terkecil
+           yang tetap memenuhi semua jendela waktu
+        4. Lokasi yang tidak dapat disisipkan dicatat sebagai tidak terlayani
+        
+        Kelayakan tiap kandidat posisi dicek dalam O(1) dengan dua array:
+        - mulai[p]: waktu mulai layanan paling awal di posisi p (maju)
+        - batas[p]: waktu mulai layanan paling lambat di posisi p agar
+          seluruh sisa rute tetap tepat waktu (mundur)
+        Kedua array diperbarui dalam O(n) setelah setiap penyisipan.
+        
+        Kompleksitas: O(n²)
+        
+        Args:
+            depot_id: ID depot (default: 0)
+            jam_mulai: Waktu berangkat dari depot (menit sejak 00:00)
+            kecepatan: Kecepatan rata-rata (km/jam)
+            
+        Returns:
+            HasilRute dengan tambahan jadwal dan tidak_terlayani
+        """
+        jendela = {i: get_jendela_waktu(loc) for i, loc in self.lokasi.items()}
+        koordinat = {i: (loc["lat"], loc["long"]) for i, loc in self.lokasi.items()}
+        menit_per_km = 60 / kecepatan
+        
+        buka_depot, tutup_depot, _ = jendela[depot_id]
+        rute = [depot_id, depot_id]
+        leg = [0.0]
+        mulai = [max(jam_mulai, buka_depot), 0.0]
+        batas = [tutup_depot, tutup_depot]
+        
+        def perbarui_maju(dari):
+            for p in range(max(dari, 1), len(rute)):
+                tiba = mulai[p - 1] + jendela[rute[p - 1]][2] + leg[p - 1] * menit_per_km
+                mulai[p] = max(tiba, jendela[rute[p]][0])
+        
+        def perbarui_mundur(dari):
+            for p in range(min(dari, len(rute) - 2), -1, -1):
+                _, tutup, layanan = jendela[rute[p]]
+                batas[p] = min(tutup, batas[p + 1] - leg[p] * menit_per_km - layanan)
+        
+        perbarui_maju(1)
+        perbarui_mundur(0)
+        
+        urutan = sorted(
+            (i for i in self.lokasi if i != depot_id),
+            key=lambda i: (jendela[i][1], jendela[i][0],
+                           -self._jarak_koordinat(*koordinat[depot_id], *koordinat[i]))
+        )
+        tidak_terlayani = []
+        
+        for u in urutan:
+            buka_u, tutup_u, layanan_u = jendela[u]
+            lat_u, long_u = koordinat[u]
+            
+            # Jarak u ke setiap lokasi di rute, dihitung sekali per lokasi yang disisipkan
+            jarak_u = [self._jarak_koordinat(*koordinat[i], lat_u, long_u) for i in rute]
+            
+            posisi_terbaik = None
+            tambahan_min = float('inf')
+            
+            for p in range(len(rute) - 1):
+                # Cek O(1): u tepat waktu dan lokasi berikutnya tidak melewati batas mundurnya
+                mulai_u = max(mulai[p] + jendela[rute[p]][2] + jarak_u[p] * menit_per_km, buka_u)
+                if mulai_u > tutup_u:
+                    continue
+                if mulai_u + layanan_u + jarak_u[p + 1] * menit_per_km > batas[p + 1]:
+                    continue
+                
+                tambahan = jarak_u[p] + jarak_u[p + 1] - leg[p]
+                if tambahan < tambahan_min:
+                    tambahan_min = tambahan
+                    posisi_terbaik = p + 1
+            
+            if posisi_terbaik is None:
+                tidak_terlayani.append(u)
+                continue
+            
+            q = posisi_terbaik
+            rute.insert(q, u)
+            leg[q - 1] = jarak_u[q - 1]
+            leg.insert(q, jarak_u[q])
+            mulai.insert(q, 0.0)
+            batas.insert(q, 0.0)
+            perbarui_maju(q)
+            perbarui_mundur(q)
+        
+        return HasilRute(
+            self.lokasi, rute, leg,
+            jumlah_lokasi=len(rute) - 2,
+            kecepatan=kecepatan,
+            jadwal=mulai,
+            tidak_terlayani=tidak_terlayani
+        )
+    
+    def warm_start(self, rute_lama, depot_id=0):
+        """
+        Membangun rute dari rute sebelumnya (mis. rute kemarin)
+        
+        Strategi:
+        1. Pertahankan urutan rute lama, buang lokasi yang sudah tidak ada
+        2. Sisipkan setiap lokasi baru di posisi dengan tambahan jarak terkecil
+        
+        Kompleksitas: O(n * b) dengan b = jumlah lokasi baru
+        
+        Args:
+            rute_lama: List ID lokasi dari rute sebelumnya
+            depot_id: ID depot (default: 0)
+            
+        Returns:
+            HasilRute, sama seperti nearest_neighbor()
+        """
+        terpakai = {depot_id}
+        rute = [depot_id]
+        for lokasi_id in rute_lama:
+            if lokasi_id in self.lokasi and lokasi_id not in terpakai:
+                terpakai.add(lokasi_id)
+                rute.append(lokasi_id)
+        rute.append(depot_id)
+        
+        koordinat = {i: (loc["lat"], loc["long"]) for i, loc in self.lokasi.items()}
+        leg = [self._jarak_koordinat(*koordinat[rute[p]], *koordinat[rute[p + 1]])
+               for p in range(len(rute) - 1)]
+        
+        for u in self.lokasi:
+            if u in terpakai:
+                continue
+            jarak_u = [self._jarak_koordinat(*koordinat[i], *koordinat[u]) for i in rute]
+            q = 1 + min(range(len(rute) - 1), key=lambda p: jarak_u[p] + jarak_u[p + 1] - leg[p])
+            rute.insert(q, u)
+            leg[q - 1] = jarak_u[q - 1]
+            leg.insert(q, jarak_u[q])
+        
+        return self._susun_hasil(rute, leg)
     
     def hitung_rute_random(self, depot_id=0):
         """
@@ -133,34 +461,26 @@ class AlgoritmaGreedy:
             depot_id: ID depot
             
         Returns:
-            Dictionary dengan rute random, total jarak
+            HasilRute dengan rute random, total jarak
         """
         import random
         
-        semua_lokasi = list(get_semua_lokasi())
+        semua_lokasi = list(self.lokasi)
         semua_lokasi.remove(depot_id)
         random.shuffle(semua_lokasi)
         
         rute = [depot_id] + semua_lokasi + [depot_id]
         
-        total_jarak = 0
-        for i in range(len(rute) - 1):
-            total_jarak += self.hitung_jarak(rute[i], rute[i+1])
-        
-        return {
-            "rute": rute,
-            "total_jarak": round(total_jarak, 2),
-            "jumlah_lokasi": len(get_semua_lokasi()) - 1,
-            "waktu_tempuh_menit": round((total_jarak / 40) * 60, 2)
-        }
+        return self._susun_hasil(rute)
     
-    def analisis_performa(self, hasil_greedy, hasil_random):
+    def analisis_performa(self, hasil_greedy, hasil_random, hasil_hilbert=None):
         """
         Analisis performa algoritma Greedy vs Random
         
         Args:
             hasil_greedy: Hasil dari nearest_neighbor()
             hasil_random: Hasil dari hitung_rute_random()
+            hasil_hilbert: Hasil dari kurva_hilbert() sebagai baseline cepat (opsional)
             
         Returns:
             Dictionary dengan analisis
@@ -170,7 +490,7 @@ class AlgoritmaGreedy:
         
         efisiensi = ((jarak_random - jarak_greedy) / jarak_random) * 100
         
-        return {
+        analisis = {
             "jarak_greedy": jarak_greedy,
             "jarak_random": jarak_random,
             "penghematan_jarak": round(jarak_random - jarak_greedy, 2),
@@ -179,3 +499,91 @@ class AlgoritmaGreedy:
             "efisiensi_persen": round(efisiensi, 2),
             "waktu_hemat_menit": round((hasil_random["waktu_tempuh_menit"] - hasil_greedy["waktu_tempuh_menit"]), 2)
         }
+        
+        if hasil_hilbert is not None:
+            jarak_hilbert = hasil_hilbert["total_jarak"]
+            analisis["jarak_hilbert"] = jarak_hilbert
+            analisis["penghematan_vs_hilbert"] = round(jarak_hilbert - jarak_greedy, 2)
+            analisis["persentase_penghematan_vs_hilbert"] = round(
+                ((jarak_hilbert - jarak_greedy) / jarak_hilbert) * 100, 2
+            )
+        
+        return analisis
+
+
+class _IndeksGrid:
+    """Indeks grid seragam untuk pencarian tetangga terdekat pada bidang 2D"""
+    
+    def __init__(self, titik, ukuran_sel=None):
+        """
+        Args:
+            titik: Dictionary id -> (x, y) dalam km
+            ukuran_sel: Sisi sel grid (km); default ~2 titik per sel
+        """
+        self.titik = titik
+        
+        if ukuran_sel is None:
+            xs = [x for x, _ in titik.values()]
+            ys = [y for _, y in titik.values()]
+            lebar = max(xs) - min(xs)
+            tinggi = max(ys) - min(ys)
+            luas = max(lebar * tinggi, max(lebar, tinggi) ** 2 / len(titik), 1e-9)
+            ukuran_sel = math.sqrt(2 * luas / len(titik))
+        self.ukuran_sel = ukuran_sel
+        
+        self.sel = {}
+        for i, (x, y) in titik.items():
+            self.sel.setdefault(self._kunci(x, y), set()).add(i)
+        self.jumlah = len(titik)
+        
+        kunci = list(self.sel) or [(0, 0)]
+        self.batas = (
+            min(cx for cx, _ in kunci), max(cx for cx, _ in kunci),
+            min(cy for _, cy in kunci), max(cy for _, cy in kunci)
+        )
+    
+    def _kunci(self, x, y):
+        return (math.floor(x / self.ukuran_sel), math.floor(y / self.ukuran_sel))
+    
+    def hapus(self, i):
+        """Menghapus titik dari indeks (abaikan jika sudah terhapus)"""
+        sel = self.sel.get(self._kunci(*self.titik[i]))
+        if sel and i in sel:
+            sel.remove(i)
+            self.jumlah -= 1
+    
+    def terdekat(self, x, y, k, kecuali=None):
+        """
+        Mencari k titik terdekat dari (x, y)
+        
+        Pencarian melebar cincin demi cincin dan berhenti begitu jarak
+        kandidat ke-k tidak lebih jauh dari radius cincin yang sudah diperiksa.
+        
+        Returns:
+            List id titik, urut dari yang terdekat
+        """
+        cx, cy = self._kunci(x, y)
+        min_cx, max_cx, min_cy, max_cy = self.batas
+        r_maks = max(cx - min_cx, max_cx - cx, cy - min_cy, max_cy - cy, 0)
+        
+        hasil = []
+        for r in range(r_maks + 1):
+            if r == 0:
+                sel_cincin = [(cx, cy)]
+            else:
+                sel_cincin = [(cx + dx, cy + dy) for dx in range(-r, r + 1) for dy in (-r, r)]
+                sel_cincin += [(cx + dx, cy + dy) for dx in (-r, r) for dy in range(-r + 1, r)]
+            
+            for kunci in sel_cincin:
+                for i in self.sel.get(kunci, ()):
+                    if i != kecuali:
+                        px, py = self.titik[i]
+                        hasil.append(((px - x) ** 2 + (py - y) ** 2, i))
+            
+            if len(hasil) >= k:
+                hasil = heapq.nsmallest(k, hasil)
+                if hasil[-1][0] <= (r * self.ukuran_sel) ** 2:
+                    break
+        
+        hasil.sort()
+        return [i for _, i in hasil[:k]]
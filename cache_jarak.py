@@ -0,0 +1,98 @@
+"""
+Cache Jarak Bersama
+Cache LRU yang aman-thread dengan batas memori untuk hasil perhitungan jarak
+"""
+
+import threading
+from collections import OrderedDict
+
+class CacheJarak:
+    """Cache jarak bersama dengan batas memori dan eviksi LRU"""
+    
+    # Perkiraan memori per entri: kunci ((lat, long), (lat, long)),
+    # nilai float, dan node OrderedDict (diukur dengan tracemalloc)
+    BYTE_PER_ENTRI = 320
+    
+    def __init__(self, batas_memori_mb=64):
+        """
+        Inisialisasi cache
+        
+        Args:
+            batas_memori_mb: Anggaran memori cache dalam megabyte
+        """
+        self.maks_entri = max(1, int(batas_memori_mb * 1024 * 1024 / self.BYTE_PER_ENTRI))
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hit = 0
+        self.miss = 0
+        self.eviksi = 0
+    
+    @staticmethod
+    def buat_kunci(lat1, long1, lat2, long2):
+        """
+        Membuat kunci simetris dari nilai koordinat
+        
+        Kunci berbasis koordinat (bukan ID lokasi) sehingga entri dari
+        dataset lain dengan ID yang sama tidak pernah salah terpakai.
+        """
+        a = (lat1, long1)
+        b = (lat2, long2)
+        return (a, b) if a <= b else (b, a)
+    
+    def ambil(self, kunci):
+        """
+        Mengambil jarak dari cache
+        
+        Returns:
+            Jarak dalam kilometer, atau None jika tidak ada di cache
+        """
+        with self._lock:
+            jarak = self._data.get(kunci)
+            if jarak is None:
+                self.miss += 1
+                return None
+            self._data.move_to_end(kunci)
+            self.hit += 1
+            return jarak
+    
+    def simpan(self, kunci, jarak):
+        """Menyimpan jarak ke cache, mengeluarkan entri paling lama tidak dipakai jika penuh"""
+        with self._lock:
+            self._data[kunci] = jarak
+            self._data.move_to_end(kunci)
+            while len(self._data) > self.maks_entri:
+                self._data.popitem(last=False)
+                self.eviksi += 1
+    
+    def kosongkan(self):
+        """Menghapus semua entri dan mereset statistik"""
+        with self._lock:
+            self._data.clear()
+            self.hit = 0
+            self.miss = 0
+            self.eviksi = 0
+    
+    def statistik(self):
+        """
+        Statistik pemakaian cache
+        
+        Returns:
+            Dictionary dengan jumlah hit, miss, eviksi, dan ukuran cache
+        """
+        with self._lock:
+            total = self.hit + self.miss
+            return {
+                "hit": self.hit,
+                "miss": self.miss,
+                "eviksi": self.eviksi,
+                "jumlah_entri": len(self._data),
+                "maks_entri": self.maks_entri,
+                "rasio_hit": round(self.hit / total * 100, 2) if total else 0.0
+            }
+    
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+# Cache bawaan yang dipakai bersama oleh semua instance AlgoritmaGreedy
+CACHE_JARAK_BERSAMA = CacheJarak()
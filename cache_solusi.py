@@ -0,0 +1,311 @@
+"""
+Cache Solusi Rute
+Menyimpan rute hasil solver di disk dan memakai ulang rute hari sebelumnya
+sebagai warm-start ketika himpunan lokasi sebagian besar sama
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import threading
+import time
+from data_lokasi import get_jendela_waktu
+
+class CacheSolusi:
+    """Cache solusi rute di disk dengan eviksi LRU berbatas ukuran"""
+    
+    NAMA_INDEKS = "indeks.json"
+    
+    # Solver yang hasilnya bergantung pada jendela waktu; tidak di-warm-start
+    SOLVER_JENDELA_WAKTU = {"insertion_jendela_waktu"}
+    
+    def __init__(self, direktori=".cache_rute", batas_disk_mb=50, ambang_overlap=0.5):
+        """
+        Inisialisasi cache
+        
+        Args:
+            direktori: Direktori penyimpanan cache
+            batas_disk_mb: Batas total ukuran file solusi dalam megabyte
+            ambang_overlap: Overlap minimum (Jaccard) agar rute lama dipakai untuk warm-start
+        """
+        self.direktori = direktori
+        self.batas_byte = int(batas_disk_mb * 1024 * 1024)
+        self.ambang_overlap = ambang_overlap
+        self._lock = threading.Lock()
+        self.hit = 0
+        self.warm = 0
+        self.miss = 0
+        self.status_terakhir = None
+        
+        os.makedirs(direktori, exist_ok=True)
+        self._indeks = self._baca_json(self._path(self.NAMA_INDEKS)) or {}
+    
+    # ------------------------------------------------------------------
+    # Penyimpanan
+    # ------------------------------------------------------------------
+    
+    def _path(self, nama):
+        return os.path.join(self.direktori, nama)
+    
+    @staticmethod
+    def _baca_json(path):
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    @staticmethod
+    def _tulis_json(path, data):
+        """Tulis atomik: file sementara lalu os.replace"""
+        sementara = f"{path}.{os.getpid()}.tmp"
+        with open(sementara, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(sementara, path)
+        return os.path.getsize(path)
+    
+    def _evict(self):
+        """Hapus entri yang paling lama tidak dipakai sampai ukuran total di bawah batas"""
+        total = sum(info["ukuran"] for info in self._indeks.values())
+        for sidik in sorted(self._indeks, key=lambda s: self._indeks[s]["dipakai"]):
+            if total <= self.batas_byte:
+                break
+            total -= self._indeks.pop(sidik)["ukuran"]
+            try:
+                os.remove(self._path(f"{sidik}.json"))
+            except OSError:
+                pass
+    
+    # ------------------------------------------------------------------
+    # Kunci
+    # ------------------------------------------------------------------
+    
+    @staticmethod
+    def _koordinat(lokasi):
+        return (lokasi["lat"], lokasi["long"])
+    
+    @staticmethod
+    def parameter_solver(algoritma, solver, depot_id, parameter=None):
+        """
+        Argumen solver lengkap (termasuk nilai default), tanpa depot_id
+        
+        Dinormalisasi lewat signature method sehingga memanggil solver
+        dengan atau tanpa menuliskan nilai default menghasilkan kunci yang sama.
+        """
+        terikat = inspect.signature(getattr(algoritma, solver)).bind(
+            depot_id=depot_id, **(parameter or {})
+        )
+        terikat.apply_defaults()
+        argumen = dict(terikat.arguments)
+        argumen.pop("depot_id", None)
+        return argumen
+    
+    @classmethod
+    def sidik_jari(cls, lokasi_data, depot_id, algoritma, mode_jarak="euclidean", parameter=None):
+        """
+        Sidik jari (depot, himpunan lokasi, mode jarak, algoritma, parameter)
+        
+        Lokasi diwakili oleh koordinat dan jendela waktunya, bukan ID,
+        sehingga dataset hari lain dengan penomoran berbeda tetap
+        menghasilkan sidik jari yang sama, sedangkan perubahan jam buka,
+        jam tutup, atau waktu layanan menghasilkan sidik jari baru.
+        """
+        titik = sorted(
+            cls._koordinat(loc) + get_jendela_waktu(loc)
+            for lokasi_id, loc in lokasi_data.items() if lokasi_id != depot_id
+        )
+        data = {
+            "depot": cls._koordinat(lokasi_data[depot_id]) + get_jendela_waktu(lokasi_data[depot_id]),
+            "titik": titik,
+            "mode_jarak": mode_jarak,
+            "algoritma": algoritma,
+            "parameter": sorted((parameter or {}).items())
+        }
+        return hashlib.sha256(json.dumps(data).encode("utf-8")).hexdigest()
+    
+    # ------------------------------------------------------------------
+    # API
+    # ------------------------------------------------------------------
+    
+    def _ke_id(self, lokasi_data, titik, kecuali=None):
+        """Petakan daftar koordinat tersimpan ke ID lokasi saat ini (yang tidak ada dibuang)"""
+        per_koordinat = {}
+        for lokasi_id, loc in lokasi_data.items():
+            if lokasi_id != kecuali:
+                per_koordinat.setdefault(self._koordinat(loc), []).append(lokasi_id)
+        
+        rute = []
+        for lat, long in titik:
+            ids = per_koordinat.get((lat, long))
+            if ids:
+                rute.append(ids.pop())
+        return rute
+    
+    def ambil(self, lokasi_data, depot_id, algoritma, mode_jarak="euclidean", parameter=None):
+        """
+        Mengambil entri tersimpan untuk himpunan lokasi yang persis sama
+        
+        Returns:
+            Dictionary dengan rute (depot di awal dan akhir), jumlah_lokasi,
+            kecepatan, jadwal, dan tidak_terlayani, atau None
+        """
+        sidik = self.sidik_jari(lokasi_data, depot_id, algoritma, mode_jarak, parameter)
+        with self._lock:
+            if sidik not in self._indeks:
+                return None
+            data = self._baca_json(self._path(f"{sidik}.json"))
+            if data is None:
+                self._indeks.pop(sidik, None)
+                return None
+            # Waktu pakai ikut disimpan agar urutan LRU bertahan setelah restart
+            self._indeks[sidik]["dipakai"] = time.time()
+            self._tulis_json(self._path(self.NAMA_INDEKS), self._indeks)
+        
+        # Titik pertama selalu depot; sisanya dipetakan tanpa depot
+        rute = [depot_id] + self._ke_id(lokasi_data, data["titik"][1:], kecuali=depot_id) + [depot_id]
+        tidak_terlayani = data.get("tidak_terlayani")
+        
+        return {
+            "rute": rute,
+            "jumlah_lokasi": data.get("jumlah_lokasi"),
+            "kecepatan": data.get("kecepatan", 40),
+            "jadwal": data.get("jadwal"),
+            "tidak_terlayani": (
+                None if tidak_terlayani is None
+                else self._ke_id(lokasi_data, tidak_terlayani, kecuali=depot_id)
+            )
+        }
+    
+    def simpan(self, lokasi_data, depot_id, algoritma, hasil, mode_jarak="euclidean", parameter=None):
+        """
+        Menyimpan hasil rute ke disk
+        
+        Args:
+            hasil: HasilRute (rute dengan depot di awal dan akhir)
+        """
+        sidik = self.sidik_jari(lokasi_data, depot_id, algoritma, mode_jarak, parameter)
+        tidak_terlayani = hasil.tidak_terlayani
+        data = {
+            "depot": self._koordinat(lokasi_data[depot_id]),
+            "mode_jarak": mode_jarak,
+            "algoritma": algoritma,
+            "parameter": parameter,
+            "titik": [self._koordinat(lokasi_data[i]) for i in hasil.rute[:-1]],
+            "jumlah_lokasi": hasil.jumlah_lokasi,
+            "kecepatan": hasil.kecepatan,
+            "jadwal": hasil.jadwal,
+            "tidak_terlayani": (
+                None if tidak_terlayani is None
+                else [self._koordinat(lokasi_data[i]) for i in tidak_terlayani]
+            )
+        }
+        
+        with self._lock:
+            ukuran = self._tulis_json(self._path(f"{sidik}.json"), data)
+            self._indeks[sidik] = {
+                "depot": list(data["depot"]),
+                "mode_jarak": mode_jarak,
+                "algoritma": algoritma,
+                "parameter": parameter,
+                "ukuran": ukuran,
+                "dipakai": time.time()
+            }
+            self._evict()
+            self._tulis_json(self._path(self.NAMA_INDEKS), self._indeks)
+    
+    def cari_rute_mirip(self, lokasi_data, depot_id, algoritma, mode_jarak="euclidean", parameter=None):
+        """
+        Mencari rute tersimpan dengan overlap lokasi terbesar
+        
+        Hanya entri dengan depot, mode jarak, algoritma, dan parameter
+        yang sama yang dipertimbangkan.
+        
+        Returns:
+            List ID lokasi saat ini dalam urutan rute lama (lokasi yang
+            sudah tidak ada dibuang), atau None jika overlap di bawah ambang
+        """
+        depot = list(self._koordinat(lokasi_data[depot_id]))
+        titik_sekarang = {self._koordinat(loc) for loc in lokasi_data.values()}
+        
+        with self._lock:
+            kandidat = [
+                sidik for sidik, info in self._indeks.items()
+                if info["depot"] == depot and info["mode_jarak"] == mode_jarak
+                and info["algoritma"] == algoritma and info.get("parameter") == parameter
+            ]
+        
+        terbaik, overlap_terbaik = None, self.ambang_overlap
+        for sidik in kandidat:
+            data = self._baca_json(self._path(f"{sidik}.json"))
+            if data is None:
+                continue
+            titik_lama = {tuple(t) for t in data["titik"]}
+            overlap = len(titik_lama & titik_sekarang) / len(titik_lama | titik_sekarang)
+            if overlap >= overlap_terbaik:
+                terbaik, overlap_terbaik = data, overlap
+        
+        if terbaik is None:
+            return None
+        return self._ke_id(lokasi_data, terbaik["titik"])
+    
+    def _catat_status(self, status):
+        with self._lock:
+            setattr(self, status, getattr(self, status) + 1)
+            self.status_terakhir = status
+    
+    def rencanakan(self, algoritma, depot_id=0, solver="nearest_neighbor", mode_jarak="euclidean",
+                   **parameter):
+        """
+        Menghitung rute dengan memanfaatkan cache
+        
+        1. Himpunan lokasi persis sama -> rute tersimpan dipakai langsung
+        2. Overlap besar dengan rute lama -> warm-start (buang lokasi yang
+           hilang, sisipkan lokasi baru); tidak dipakai untuk solver
+           dengan jendela waktu karena warm_start tidak mengecek kelayakan
+        3. Selain itu -> jalankan solver dari awal
+        
+        Args:
+            algoritma: Instance AlgoritmaGreedy
+            depot_id: ID depot
+            solver: Nama method solver AlgoritmaGreedy
+            mode_jarak: Nama mode perhitungan jarak (bagian dari kunci cache)
+            **parameter: Argumen tambahan untuk solver (bagian dari kunci cache)
+        
+        Returns:
+            HasilRute
+        """
+        lokasi_data = algoritma.lokasi
+        parameter = self.parameter_solver(algoritma, solver, depot_id, parameter)
+        
+        entri = self.ambil(lokasi_data, depot_id, solver, mode_jarak, parameter)
+        if entri is not None:
+            self._catat_status("hit")
+            rute = entri.pop("rute")
+            return algoritma._susun_hasil(rute, **entri)
+        
+        rute_lama = None
+        if solver not in self.SOLVER_JENDELA_WAKTU:
+            rute_lama = self.cari_rute_mirip(lokasi_data, depot_id, solver, mode_jarak, parameter)
+        
+        if rute_lama is not None:
+            self._catat_status("warm")
+            hasil = algoritma.warm_start(rute_lama, depot_id=depot_id)
+        else:
+            self._catat_status("miss")
+            hasil = getattr(algoritma, solver)(depot_id=depot_id, **parameter)
+        
+        self.simpan(lokasi_data, depot_id, solver, hasil, mode_jarak, parameter)
+        return hasil
+    
+    def statistik(self):
+        """Statistik pemakaian cache"""
+        with self._lock:
+            return {
+                "hit": self.hit,
+                "warm": self.warm,
+                "miss": self.miss,
+                "jumlah_entri": len(self._indeks),
+                "ukuran_byte": sum(info["ukuran"] for info in self._indeks.values()),
+                "batas_byte": self.batas_byte
+            }
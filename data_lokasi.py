@@ -39,6 +39,17 @@ PAKET = [
     {"id": 14, "lokasi": 14, "berat": 2.3, "penerima": "Ayu"},
 ]
 
+# Jam operasional default per tipe lokasi (menit sejak 00:00) dan waktu layanan (menit)
+# Lokasi dapat menimpa nilai ini dengan kunci "buka", "tutup", dan "layanan"
+JAM_OPERASIONAL = {
+    "Pusat Distribusi": {"buka": 6 * 60, "tutup": 22 * 60, "layanan": 0},
+    "Kantor Pemerintah": {"buka": 8 * 60, "tutup": 15 * 60, "layanan": 10},
+    "Kantor": {"buka": 8 * 60, "tutup": 17 * 60, "layanan": 10},
+    "Minimarket": {"buka": 7 * 60, "tutup": 22 * 60, "layanan": 5},
+    "Toko": {"buka": 9 * 60, "tutup": 21 * 60, "layanan": 5},
+    "Rumah": {"buka": 8 * 60, "tutup": 20 * 60, "layanan": 3},
+}
+
 def get_lokasi_info(lokasi_id):
     """Mendapatkan informasi lokasi berdasarkan ID"""
     return LOKASI.get(lokasi_id, None)
@@ -50,3 +61,24 @@ def get_semua_lokasi():
 def get_semua_paket():
     """Mendapatkan semua paket"""
     return PAKET
+
+def get_jendela_waktu(lokasi):
+    """
+    Mendapatkan jendela waktu dan waktu layanan sebuah lokasi
+    
+    Tipe dicocokkan persis lebih dulu, lalu berdasarkan kata pertama
+    (mis. "Toko Buku" -> "Toko"). Tipe tidak dikenal dianggap buka sepanjang hari.
+    
+    Args:
+        lokasi: Dictionary data satu lokasi
+        
+    Returns:
+        Tuple (buka, tutup, layanan) dalam menit
+    """
+    tipe = lokasi.get("tipe", "")
+    bawaan = JAM_OPERASIONAL.get(tipe) or JAM_OPERASIONAL.get(tipe.split(" ")[0]) or {}
+    return (
+        lokasi.get("buka", bawaan.get("buka", 0)),
+        lokasi.get("tutup", bawaan.get("tutup", 24 * 60)),
+        lokasi.get("layanan", bawaan.get("layanan", 0))
+    )
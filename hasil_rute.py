@@ -0,0 +1,194 @@
+"""
+Hasil Rute Ringkas
+Objek hasil rute berbasis array yang kompatibel dengan akses gaya dictionary
+"""
+
+import math
+from array import array
+from collections.abc import Mapping, Sequence
+
+# Padanan dtype numpy (byte order native) untuk typecode array.array
+_DTYPE_NUMPY = {"q": "=i8", "d": "=f8"}
+
+def _ke_array(typecode, nilai):
+    """
+    Mengubah iterable atau numpy array menjadi array.array
+    
+    Numpy array disalin lewat buffer-nya (setelah dikonversi ke tipe yang
+    sesuai) sehingga tidak perlu iterasi per elemen di Python.
+    """
+    if hasattr(nilai, "dtype") and hasattr(nilai, "astype"):
+        hasil = array(typecode)
+        hasil.frombytes(nilai.astype(_DTYPE_NUMPY[typecode]).tobytes())
+        return hasil
+    return array(typecode, nilai)
+
+class HasilRute(Mapping):
+    """
+    Hasil rute yang disimpan sebagai array integer (rute) dan array float
+    (jarak tiap leg)
+    
+    Nama lokasi dan detail per leg baru dibentuk saat diakses, dan jarak
+    disimpan tanpa pembulatan sehingga agregasi tetap presisi. Akses
+    hasil["rute"], hasil["total_jarak"], dst. tetap berfungsi seperti
+    dictionary hasil sebelumnya.
+    """
+    
+    __slots__ = ("_lokasi", "_rute", "_jarak_leg", "_total_jarak", "_jumlah_lokasi", "_kecepatan",
+                 "_jadwal", "_tidak_terlayani")
+    
+    KUNCI = ("rute", "total_jarak", "jumlah_lokasi", "detail_rute", "waktu_tempuh_menit")
+    KUNCI_JADWAL = ("jadwal", "tidak_terlayani")
+    
+    def __init__(self, lokasi_data, rute, jarak_leg, jumlah_lokasi=None, kecepatan=40,
+                 jadwal=None, tidak_terlayani=None):
+        """
+        Args:
+            lokasi_data: Dictionary data lokasi (untuk nama lokasi)
+            rute: Urutan ID lokasi (iterable int atau numpy array)
+            jarak_leg: Jarak tiap leg dalam km (iterable float atau numpy array)
+            jumlah_lokasi: Jumlah lokasi pengiriman (default: len(lokasi_data) - 1)
+            kecepatan: Kecepatan rata-rata (km/jam) untuk waktu tempuh
+            jadwal: Waktu mulai layanan (menit) di tiap posisi rute (opsional)
+            tidak_terlayani: ID lokasi yang tidak dapat dijadwalkan (opsional)
+        """
+        self._lokasi = lokasi_data
+        self._rute = _ke_array("q", rute)
+        self._jarak_leg = _ke_array("d", jarak_leg)
+        self._total_jarak = math.fsum(self._jarak_leg)
+        self._jumlah_lokasi = len(lokasi_data) - 1 if jumlah_lokasi is None else jumlah_lokasi
+        self._kecepatan = kecepatan
+        self._jadwal = None if jadwal is None else array("d", jadwal)
+        self._tidak_terlayani = None if tidak_terlayani is None else tuple(tidak_terlayani)
+    
+    # ------------------------------------------------------------------
+    # Atribut
+    # ------------------------------------------------------------------
+    
+    @property
+    def rute(self):
+        """Urutan ID lokasi sebagai list"""
+        return self._rute.tolist()
+    
+    @property
+    def array_rute(self):
+        """Urutan ID lokasi sebagai array (tanpa salinan)"""
+        return self._rute
+    
+    @property
+    def jarak_leg(self):
+        """Jarak tiap leg (km) tanpa pembulatan"""
+        return self._jarak_leg
+    
+    @property
+    def total_jarak_presisi(self):
+        """Total jarak (km) tanpa pembulatan"""
+        return self._total_jarak
+    
+    @property
+    def total_jarak(self):
+        return round(self._total_jarak, 2)
+    
+    @property
+    def jumlah_lokasi(self):
+        return self._jumlah_lokasi
+    
+    @property
+    def kecepatan(self):
+        """Kecepatan rata-rata (km/jam) yang dipakai untuk waktu tempuh"""
+        return self._kecepatan
+    
+    @property
+    def waktu_tempuh_menit(self):
+        return round((self._total_jarak / self._kecepatan) * 60, 2)
+    
+    @property
+    def jadwal(self):
+        """Waktu mulai layanan (menit sejak 00:00) per posisi rute, atau None"""
+        return None if self._jadwal is None else self._jadwal.tolist()
+    
+    @property
+    def tidak_terlayani(self):
+        """ID lokasi yang tidak masuk rute karena jendela waktu, atau None"""
+        return None if self._tidak_terlayani is None else list(self._tidak_terlayani)
+    
+    @property
+    def detail_rute(self):
+        """Detail per leg, dibentuk saat diakses"""
+        return _DetailRute(self)
+    
+    # ------------------------------------------------------------------
+    # Kompatibilitas dictionary
+    # ------------------------------------------------------------------
+    
+    def _kunci(self):
+        if self._jadwal is None:
+            return self.KUNCI
+        return self.KUNCI + self.KUNCI_JADWAL
+    
+    def __getitem__(self, kunci):
+        if kunci not in self._kunci():
+            raise KeyError(kunci)
+        return getattr(self, kunci)
+    
+    def __iter__(self):
+        return iter(self._kunci())
+    
+    def __len__(self):
+        return len(self._kunci())
+    
+    def __eq__(self, other):
+        if isinstance(other, HasilRute):
+            return (self._rute == other._rute
+                    and self._jarak_leg == other._jarak_leg
+                    and self._jumlah_lokasi == other._jumlah_lokasi
+                    and self._kecepatan == other._kecepatan
+                    and self._jadwal == other._jadwal
+                    and self._tidak_terlayani == other._tidak_terlayani)
+        return Mapping.__eq__(self, other)
+    
+    __hash__ = None
+    
+    def __repr__(self):
+        return (f"HasilRute(jumlah_lokasi={self._jumlah_lokasi}, "
+                f"total_jarak={self.total_jarak}, leg={len(self._jarak_leg)})")
+
+class _DetailRute(Sequence):
+    """Tampilan lazy atas leg-leg rute dalam format {"dari", "ke", "jarak"}"""
+    
+    __slots__ = ("_hasil",)
+    
+    def __init__(self, hasil):
+        self._hasil = hasil
+    
+    def _leg(self, i):
+        hasil = self._hasil
+        return {
+            "dari": hasil._lokasi[hasil._rute[i]]["nama"],
+            "ke": hasil._lokasi[hasil._rute[i + 1]]["nama"],
+            "jarak": round(hasil._jarak_leg[i], 2)
+        }
+    
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._leg(j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("indeks leg di luar jangkauan")
+        return self._leg(i)
+    
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._leg(i)
+    
+    def __len__(self):
+        return len(self._hasil._jarak_leg)
+    
+    def __eq__(self, other):
+        # Dibandingkan seperti list agar dict(hasil) tetap setara dengan dict hasil lain
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return list(self) == list(other)
+        return NotImplemented
+    
+    __hash__ = None
@@ -0,0 +1,254 @@
+"""
+Simulator Replay Hari Pengiriman
+Memutar ulang aliran event paket (rekaman atau sintetis) melalui solver rute
+untuk mengukur latensi perencanaan, jumlah re-plan, dan throughput
+"""
+
+import json
+import random
+import time
+from data_lokasi import LOKASI, get_semua_lokasi
+from algoritma_greedy import AlgoritmaGreedy
+
+# ============================================================================
+# SUMBER EVENT
+# ============================================================================
+
+def baca_stream_paket(path):
+    """
+    Membaca event paket dari file JSON Lines secara bertahap
+    
+    Setiap baris berisi satu event, contoh:
+    {"waktu": 12.5, "paket": {"id": 1, "lokasi": 3, "berat": 2.0, "penerima": "Budi"}}
+    
+    Args:
+        path: Path file rekaman (event harus urut berdasarkan waktu)
+    
+    Yields:
+        Dictionary event, satu per baris file
+    """
+    with open(path, encoding="utf-8") as f:
+        for baris in f:
+            baris = baris.strip()
+            if baris:
+                yield json.loads(baris)
+
+def stream_paket_sintetis(jumlah, lokasi_ids, depot_id=0, paket_per_menit=2.0, seed=None):
+    """
+    Membangkitkan event paket sintetis dengan kedatangan Poisson
+    
+    Args:
+        jumlah: Jumlah event yang dibangkitkan
+        lokasi_ids: ID lokasi tujuan yang mungkin
+        depot_id: ID depot (tidak pernah menjadi tujuan)
+        paket_per_menit: Rata-rata laju kedatangan paket
+        seed: Seed random agar simulasi dapat diulang
+    
+    Yields:
+        Dictionary event dengan format yang sama seperti baca_stream_paket()
+    """
+    rng = random.Random(seed)
+    tujuan = [lokasi_id for lokasi_id in lokasi_ids if lokasi_id != depot_id]
+    waktu = 0.0
+    
+    for paket_id in range(1, jumlah + 1):
+        waktu += rng.expovariate(paket_per_menit)
+        yield {
+            "waktu": waktu,
+            "paket": {
+                "id": paket_id,
+                "lokasi": rng.choice(tujuan),
+                "berat": round(rng.uniform(0.2, 5.0), 1),
+                "penerima": f"Penerima {paket_id}"
+            }
+        }
+
+# ============================================================================
+# SIMULATOR
+# ============================================================================
+
+class SimulatorHarian:
+    """Simulator event-driven untuk gelombang dispatch dalam satu hari"""
+    
+    UKURAN_SAMPEL_LATENSI = 10000
+    
+    def __init__(self, lokasi_data, depot_id=0, solver="nearest_neighbor",
+                 kapasitas_gelombang=20, interval_dispatch_menit=60, jeda_replan_menit=0):
+        """
+        Inisialisasi simulator
+        
+        Args:
+            lokasi_data: Dictionary berisi data lokasi dengan lat/long
+            depot_id: ID depot
+            solver: Nama method AlgoritmaGreedy yang dipakai untuk perencanaan
+            kapasitas_gelombang: Jumlah lokasi maksimum per gelombang dispatch
+            interval_dispatch_menit: Gelombang dikirim paling lambat setiap interval ini
+            jeda_replan_menit: Jeda minimum (waktu simulasi) antar re-plan
+        """
+        self.lokasi = lokasi_data
+        self.depot_id = depot_id
+        self.solver = solver
+        self.kapasitas_gelombang = kapasitas_gelombang
+        self.interval_dispatch_menit = interval_dispatch_menit
+        self.jeda_replan_menit = jeda_replan_menit
+    
+    def _rencanakan(self, tujuan):
+        """Jalankan solver untuk depot + lokasi tujuan, kembalikan (hasil, latensi detik)"""
+        subset = {self.depot_id: self.lokasi[self.depot_id]}
+        for lokasi_id in tujuan:
+            subset[lokasi_id] = self.lokasi[lokasi_id]
+        
+        mulai = time.perf_counter()
+        algoritma = AlgoritmaGreedy(subset)
+        hasil = getattr(algoritma, self.solver)(depot_id=self.depot_id)
+        return hasil, time.perf_counter() - mulai
+    
+    def jalankan(self, events):
+        """
+        Memutar ulang aliran event melalui solver
+        
+        Event dikonsumsi satu per satu sehingga aliran berukuran jutaan
+        event tidak pernah dimuat sekaligus ke memori.
+        
+        Args:
+            events: Iterable event paket (lihat baca_stream_paket())
+        
+        Returns:
+            Dictionary dengan statistik latensi, re-plan, dan throughput
+        """
+        rng = random.Random(0)
+        sampel_latensi = []
+        jumlah_rencana = 0
+        total_latensi = 0.0
+        latensi_maks = 0.0
+        
+        jumlah_event = 0
+        jumlah_paket = 0
+        jumlah_gelombang = 0
+        jumlah_replan = 0
+        total_jarak = 0.0
+        
+        tujuan = set()
+        rencana = None
+        rencana_usang = False
+        waktu_rencana = 0.0
+        waktu_dispatch = 0.0
+        
+        def catat_latensi(latensi):
+            nonlocal jumlah_rencana, total_latensi, latensi_maks
+            jumlah_rencana += 1
+            total_latensi += latensi
+            latensi_maks = max(latensi_maks, latensi)
+            # Reservoir sampling agar memori tetap konstan
+            if len(sampel_latensi) < self.UKURAN_SAMPEL_LATENSI:
+                sampel_latensi.append(latensi)
+            else:
+                j = rng.randrange(jumlah_rencana)
+                if j < self.UKURAN_SAMPEL_LATENSI:
+                    sampel_latensi[j] = latensi
+        
+        def dispatch(waktu):
+            nonlocal rencana, rencana_usang, waktu_dispatch, jumlah_gelombang, jumlah_replan, total_jarak
+            if tujuan:
+                if rencana is None or rencana_usang:
+                    if rencana is not None:
+                        jumlah_replan += 1
+                    rencana, latensi = self._rencanakan(tujuan)
+                    catat_latensi(latensi)
+                jumlah_gelombang += 1
+                total_jarak += rencana.total_jarak_presisi
+                tujuan.clear()
+            rencana = None
+            rencana_usang = False
+            waktu_dispatch = waktu
+        
+        mulai = time.perf_counter()
+        
+        for event in events:
+            jumlah_event += 1
+            waktu = event["waktu"]
+            
+            if waktu - waktu_dispatch >= self.interval_dispatch_menit:
+                dispatch(waktu)
+            
+            paket = event.get("paket")
+            if paket is None:
+                continue
+            jumlah_paket += 1
+            
+            lokasi_id = paket["lokasi"]
+            if lokasi_id == self.depot_id or lokasi_id in tujuan:
+                continue
+            
+            tujuan.add(lokasi_id)
+            rencana_usang = True
+            
+            if rencana is None or waktu - waktu_rencana >= self.jeda_replan_menit:
+                if rencana is not None:
+                    jumlah_replan += 1
+                rencana, latensi = self._rencanakan(tujuan)
+                catat_latensi(latensi)
+                rencana_usang = False
+                waktu_rencana = waktu
+            
+            if len(tujuan) >= self.kapasitas_gelombang:
+                dispatch(waktu)
+        
+        dispatch(waktu_dispatch)
+        durasi = time.perf_counter() - mulai
+        
+        sampel_latensi.sort()
+        
+        def persentil(p):
+            if not sampel_latensi:
+                return 0.0
+            return sampel_latensi[min(len(sampel_latensi) - 1, int(p * len(sampel_latensi)))]
+        
+        return {
+            "jumlah_event": jumlah_event,
+            "jumlah_paket": jumlah_paket,
+            "jumlah_gelombang": jumlah_gelombang,
+            "jumlah_rencana": jumlah_rencana,
+            "jumlah_replan": jumlah_replan,
+            "total_jarak": round(total_jarak, 2),
+            "latensi_rata_ms": round(total_latensi / jumlah_rencana * 1000, 3) if jumlah_rencana else 0.0,
+            "latensi_p50_ms": round(persentil(0.50) * 1000, 3),
+            "latensi_p95_ms": round(persentil(0.95) * 1000, 3),
+            "latensi_maks_ms": round(latensi_maks * 1000, 3),
+            "durasi_detik": round(durasi, 3),
+            "throughput_event_per_detik": round(jumlah_event / durasi, 1) if durasi > 0 else 0.0
+        }
+
+# ============================================================================
+# PROGRAM UTAMA
+# ============================================================================
+
+def main():
+    """Jalankan simulasi satu hari dengan stream sintetis"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Replay hari pengiriman melalui solver rute")
+    parser.add_argument("--file", help="File JSON Lines berisi rekaman event paket")
+    parser.add_argument("--jumlah", type=int, default=10000, help="Jumlah event sintetis")
+    parser.add_argument("--solver", default="nearest_neighbor", help="Nama method solver")
+    parser.add_argument("--kapasitas", type=int, default=20, help="Lokasi per gelombang")
+    parser.add_argument("--seed", type=int, default=None, help="Seed stream sintetis")
+    args = parser.parse_args()
+    
+    if args.file:
+        events = baca_stream_paket(args.file)
+    else:
+        events = stream_paket_sintetis(args.jumlah, get_semua_lokasi(), seed=args.seed)
+    
+    simulator = SimulatorHarian(LOKASI, solver=args.solver, kapasitas_gelombang=args.kapasitas)
+    laporan = simulator.jalankan(events)
+    
+    print("=" * 80)
+    print("LAPORAN REPLAY HARI PENGIRIMAN")
+    print("=" * 80)
+    for kunci, nilai in laporan.items():
+        print(f"   {kunci:<30} {nilai}")
+    print("=" * 80)
+
+if __name__ == "__main__":
+    main()
@@ -6,9 +6,11 @@ import streamlit as st
 import folium
 from streamlit_folium import st_folium
 import pandas as pd
+import numpy as np
 from datetime import datetime
 from data_lokasi import LOKASI, get_semua_lokasi, get_semua_paket
 from algoritma_greedy import AlgoritmaGreedy
+from cache_solusi import CacheSolusi
 
 # ============================================================================
 # KONFIGURASI STREAMLIT
@@ -53,12 +55,96 @@ with st.sidebar:
     total_berat = sum([p["berat"] for p in get_semua_paket()])
     st.metric("Total Berat (kg)", f"{total_berat:.1f}")
 
+# ============================================================================
+# TABEL DATA (KOLOMNAR, DI-CACHE, PER HALAMAN)
+# ============================================================================
+
+BARIS_PER_HALAMAN = 50
+
+@st.cache_data(show_spinner=False)
+def buat_tabel_lokasi():
+    """Tabel lokasi dibangun sekali per kolom dari LOKASI"""
+    df = pd.DataFrame.from_dict(LOKASI, orient="index").sort_index()
+    df.index.name = "ID"
+    df = df.rename(columns={
+        "nama": "Nama Lokasi",
+        "lat": "Latitude",
+        "long": "Longitude",
+        "tipe": "Tipe"
+    })
+    return df[["Nama Lokasi", "Latitude", "Longitude", "Tipe"]]
+
+@st.cache_data(show_spinner=False)
+def buat_tabel_lokasi_rute(rute):
+    """Tabel lokasi dengan penanda 'Di Rute' untuk satu hasil rute"""
+    df = buat_tabel_lokasi()
+    df["Di Rute"] = np.where(df.index.isin(rute), "✓", "")
+    return df.reset_index()
+
+@st.cache_data(show_spinner=False)
+def buat_tabel_paket():
+    """Tabel paket dengan nama lokasi diambil lewat reindex, bukan per baris"""
+    df = pd.DataFrame(get_semua_paket())
+    nama = buat_tabel_lokasi()["Nama Lokasi"]
+    return pd.DataFrame({
+        "ID Paket": df["id"].to_numpy(),
+        "Lokasi ID": df["lokasi"].to_numpy(),
+        "Nama Lokasi": nama.reindex(df["lokasi"]).to_numpy(),
+        "Berat (kg)": df["berat"].to_numpy(),
+        "Penerima": df["penerima"].to_numpy()
+    })
+
+@st.cache_data(show_spinner=False)
+def buat_tabel_detail(rute, _jarak_leg):
+    """Tabel detail perjalanan langsung dari array rute dan array jarak leg"""
+    lokasi = buat_tabel_lokasi()
+    posisi = lokasi.index.get_indexer(np.asarray(rute))
+    dari, ke = posisi[:-1], posisi[1:]
+    nama = lokasi["Nama Lokasi"].to_numpy()
+    
+    return pd.DataFrame({
+        "No": np.arange(1, len(dari) + 1),
+        "Dari Lokasi": nama[dari],
+        "Ke Lokasi": nama[ke],
+        "Jarak (km)": np.frombuffer(_jarak_leg, dtype=np.float64).round(2)
+    })
+
+def ambil_halaman(df, key, per_halaman=BARIS_PER_HALAMAN):
+    """
+    Ambil potongan DataFrame untuk halaman yang dipilih
+    
+    Hanya baris pada halaman aktif yang dikirim ke browser, sehingga
+    ukuran payload tidak bergantung pada jumlah lokasi.
+    """
+    jumlah_halaman = max(1, -(-len(df) // per_halaman))
+    halaman = 1
+    if jumlah_halaman > 1:
+        halaman = st.number_input(
+            f"Halaman (1-{jumlah_halaman}):",
+            min_value=1,
+            max_value=jumlah_halaman,
+            value=1,
+            step=1,
+            key=key
+        )
+    
+    awal = (halaman - 1) * per_halaman
+    akhir = min(awal + per_halaman, len(df))
+    st.caption(f"Menampilkan baris {awal + 1 if len(df) else 0}-{akhir} dari {len(df)}")
+    return df.iloc[awal:akhir]
+
 # ============================================================================
 # INISIALISASI ALGORITMA
 # ============================================================================
 
+@st.cache_resource
+def buat_cache_solusi():
+    """Satu CacheSolusi (di disk) dipakai bersama oleh semua sesi"""
+    return CacheSolusi()
+
 algoritma = AlgoritmaGreedy(LOKASI)
-hasil_greedy = algoritma.nearest_neighbor(depot_id=depot_id)
+cache_solusi = buat_cache_solusi()
+hasil_greedy = cache_solusi.rencanakan(algoritma, depot_id=depot_id)
 
 # ============================================================================
 # TAB UTAMA
@@ -167,40 +253,23 @@ with tab2:
     # Bagian 1: Data Lokasi
     st.subheader("📍 Data Lokasi Pengiriman")
     
-    data_lokasi = []
-    for lokasi_id in sorted(LOKASI.keys()):
-        loc = LOKASI[lokasi_id]
-        is_in_route = "✓" if lokasi_id in rute_set else ""
-        data_lokasi.append({
-            "ID": lokasi_id,
-            "Nama Lokasi": loc['nama'],
-            "Latitude": f"{loc['lat']:.6f}",
-            "Longitude": f"{loc['long']:.6f}",
-            "Tipe": loc['tipe'],
-            "Di Rute": is_in_route
-        })
-    
-    df_lokasi = pd.DataFrame(data_lokasi)
-    st.dataframe(df_lokasi, use_container_width=True)
+    df_lokasi = buat_tabel_lokasi_rute(tuple(hasil_greedy['rute']))
+    st.dataframe(
+        ambil_halaman(df_lokasi, key="halaman_lokasi"),
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "Latitude": st.column_config.NumberColumn(format="%.6f"),
+            "Longitude": st.column_config.NumberColumn(format="%.6f")
+        }
+    )
     
     st.divider()
     
     # Bagian 2: Data Paket
     st.subheader("📦 Data Paket Pengiriman")
     
-    data_paket = []
-    for paket in get_semua_paket():
-        lokasi_id = paket["lokasi"]
-        lokasi_nama = LOKASI[lokasi_id]["nama"]
-        data_paket.append({
-            "ID Paket": paket['id'],
-            "Lokasi ID": lokasi_id,
-            "Nama Lokasi": lokasi_nama,
-            "Berat (kg)": paket['berat'],
-            "Penerima": paket['penerima']
-        })
-    
-    df_paket = pd.DataFrame(data_paket)
+    df_paket = buat_tabel_paket()
     
     col1, col2, col3 = st.columns(3)
     with col1:
@@ -210,7 +279,11 @@ with tab2:
     with col3:
         st.metric("Rata-rata Berat", f"{df_paket['Berat (kg)'].mean():.2f} kg")
     
-    st.dataframe(df_paket, use_container_width=True)
+    st.dataframe(
+        ambil_halaman(df_paket, key="halaman_paket"),
+        use_container_width=True,
+        hide_index=True
+    )
     
     st.divider()
     
@@ -340,18 +413,18 @@ with tab4:
     # Detail setiap perjalanan
     st.subheader("Detail Setiap Perjalanan")
     
-    detail_data = []
-    for i, detail in enumerate(hasil_greedy['detail_rute'], 1):
-        detail_data.append({
-            "No": i,
-            "Dari Lokasi": detail['dari'],
-            "Ke Lokasi": detail['ke'],
-            "Jarak (km)": f"{detail['jarak']:.2f}",
-            "Waktu (menit)": f"{detail['jarak'] / kecepatan * 60:.1f}"
-        })
-    
-    df_detail = pd.DataFrame(detail_data)
-    st.dataframe(df_detail, use_container_width=True)
+    df_detail = buat_tabel_detail(tuple(hasil_greedy.array_rute), hasil_greedy.jarak_leg)
+    halaman_detail = ambil_halaman(df_detail, key="halaman_detail").copy()
+    halaman_detail["Waktu (menit)"] = halaman_detail["Jarak (km)"] / kecepatan * 60
+    st.dataframe(
+        halaman_detail,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "Jarak (km)": st.column_config.NumberColumn(format="%.2f"),
+            "Waktu (menit)": st.column_config.NumberColumn(format="%.1f")
+        }
+    )
     
     st.divider()
     
@@ -371,7 +444,7 @@ with tab4:
         st.metric("Jumlah Lokasi", hasil_greedy['jumlah_lokasi'])
     
     with col4:
-        st.metric("Jumlah Perjalanan", len(hasil_greedy['detail_rute']))
+        st.metric("Jumlah Perjalanan", len(df_detail))
 
 # ============================================================================
 # FOOTER